@@ -1,8 +1,15 @@
+import asyncio
 import uuid
 import time
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
-from app.models.schemas import RecommendRequest, RecommendResponse, AssessmentResponse
+from app.models.schemas import (
+    RecommendRequest,
+    RecommendResponse,
+    RecommendBatchRequest,
+    RecommendBatchResponse,
+    AssessmentResponse
+)
 from app.graph.workflow import execute_query
 from app.database.sqlite_db import get_db
 from app.services.session_service import get_session_service
@@ -114,4 +121,74 @@ async def recommend_assessments(
         raise HTTPException(
             status_code=500,
             detail=f"An error occurred while processing your request: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+# Max workflows in flight per batch request
+BATCH_CONCURRENCY = 8
+
+
+@router.post("/recommend/batch", response_model=RecommendBatchResponse)
+async def recommend_assessments_batch(request: RecommendBatchRequest):
+    """
+    Batch recommendation endpoint
+
+    Accepts up to 64 queries in one request and returns one result per
+    query, amortizing per-request overhead for bulk/offline callers
+    (e.g. the testing script). Queries run concurrently server-side,
+    bounded by a semaphore. A query that fails or matches nothing gets
+    an empty result instead of failing the whole batch, and no
+    interaction history is persisted.
+
+    Args:
+        request: Batch request with list of queries
+
+    Returns:
+        One recommendation result per query, in request order
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def recommend_one(query: str) -> RecommendResponse:
+        # Validate query
+        is_valid, error_msg = validate_query_length(query)
+        if not is_valid:
+            logger.warning(f"Invalid query in batch: {error_msg}")
+            return RecommendResponse(recommended_assessments=[])
+
+        session_id = str(uuid.uuid4())
+
+        try:
+            async with semaphore:
+                final_state = await execute_query(query, session_id)
+
+            recommendations = final_state.get('final_recommendations', [])
+
+            if not recommendations:
+                return RecommendResponse(recommended_assessments=[])
+
+            formatted_recommendations = format_assessment_response(recommendations)
+
+            # Ensure we return between 1-10 assessments
+            if len(formatted_recommendations) > 10:
+                formatted_recommendations = formatted_recommendations[:10]
+
+            return RecommendResponse(recommended_assessments=formatted_recommendations)
+
+        except Exception as e:
+            logger.error(f"Batch query failed: {e}")
+            return RecommendResponse(recommended_assessments=[])
+
+    start_time = time.time()
+
+    logger.info(f"Processing batch recommendation request ({len(request.queries)} queries)")
+
+    results = await asyncio.gather(*(
+        recommend_one(query) for query in request.queries
+    ))
+
+    logger.info(
+        f"Batch recommendation completed in {time.time() - start_time:.2f}s - "
+        f"{len(results)} results"
+    )
+
+    return RecommendBatchResponse(results=results)
\ No newline at end of file
@@ -41,16 +41,22 @@ class Settings(BaseSettings):
     SHL_CATALOG_URL: str = "https://www.shl.com/solutions/products/product-catalog/"
     SCRAPER_DELAY: float = 1.5
     SCRAPER_TIMEOUT: int = 30
+    SCRAPER_CONCURRENCY: int = 4
     
     # RAG Configuration
     RAG_TOP_K: int = 15
     RAG_FINAL_SELECT_MIN: int = 5
     RAG_FINAL_SELECT_MAX: int = 10
     EMBEDDING_BATCH_SIZE: int = 10
+    INDEX_BATCH_SIZE: int = 64
+    INDEX_MAX_CONCURRENCY: int = 4
     
     # Assessment Data
     ASSESSMENTS_JSON_PATH: str = "./data/shl_assessments.json"
     TRAIN_SET_PATH: str = "./data/labeled_train_set.json"
+
+    # Evaluation Configuration
+    EVAL_CONCURRENCY: int = 8
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -19,6 +19,7 @@ from app.api.routes import (
     test_types,
     refresh
 )
+from app.utils.http import close_client
 from app.utils.logger import get_logger
 
 logger = get_logger("main")
@@ -97,7 +98,10 @@ async def lifespan(app: FastAPI):
     try:
         # Stop auto-refresh
         await refresh.stop_auto_refresh()
-        
+
+        # Close the shared HTTP client
+        await close_client()
+
         # Close databases
         await close_chroma()
         await close_db()
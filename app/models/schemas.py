@@ -63,6 +63,16 @@ class RecommendResponse(BaseModel):
         }
 
 
+class RecommendBatchRequest(BaseModel):
+    """Request schema for batch recommendation endpoint"""
+    queries: List[str] = Field(..., min_length=1, max_length=64, description="Job descriptions or natural language queries")
+
+
+class RecommendBatchResponse(BaseModel):
+    """Response schema for batch recommendation endpoint"""
+    results: List[RecommendResponse]
+
+
 class HealthResponse(BaseModel):
     """Health check response"""
     status: str = Field(default="healthy")
@@ -1,8 +1,9 @@
 import re
 from typing import Optional, Dict, Any
-import requests
+import httpx
 from bs4 import BeautifulSoup
 from app.config import settings
+from app.utils.http import get_client
 from app.utils.logger import get_logger
 
 logger = get_logger("jd_fetcher_service")
@@ -30,8 +31,10 @@ class JDFetcherService:
         try:
             logger.info(f"Fetching JD from URL: {url}")
             
-            # Fetch the page
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            # Fetch the page through the shared client (keep-alive
+            # pooling) without blocking the event loop
+            client = await get_client()
+            response = await client.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse HTML
@@ -61,7 +64,7 @@ class JDFetcherService:
                 "metadata": metadata
             }
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to fetch URL {url}: {e}")
             return {
                 "success": False,
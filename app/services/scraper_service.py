@@ -1,7 +1,7 @@
 import asyncio
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
 import requests
 from bs4 import BeautifulSoup
 import re
@@ -206,63 +206,96 @@ class ScraperService:
             logger.error(f"Error fetching test details from {test_url}: {e}")
             return {}
     
-    async def scrape_all_tests(self) -> Dict[str, Dict[str, Any]]:
-        """Scrape all tests from the catalog with pagination"""
+    async def _collect_catalog_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Scrape the paginated catalog listing (no per-test details)"""
         all_tests = {}
-        
+
         logger.info("Fetching first page to determine total pages...")
         first_page_soup = self.get_catalog_page(0)
-        
+
         if not first_page_soup:
             logger.error("Failed to fetch first page")
             return all_tests
-        
+
         total_pages = self.get_total_pages(first_page_soup)
         logger.info(f"Total pages to scrape: {total_pages}")
-        
+
         # Process first page
         logger.info(f"Processing page 1/{total_pages}...")
         tests_page_1 = self.extract_tests_from_page(first_page_soup)
         logger.info(f"Found {len(tests_page_1)} tests on page 1")
-        
+
         for test in tests_page_1:
             all_tests[test['url']] = test
-        
+
         await asyncio.sleep(self.delay)
-        
+
         # Process remaining pages
         items_per_page = 12
         for page_num in range(2, total_pages + 1):
             start_index = (page_num - 1) * items_per_page
             logger.info(f"Processing page {page_num}/{total_pages} (start={start_index})...")
-            
+
             page_soup = self.get_catalog_page(start_index)
             if not page_soup:
                 logger.warning(f"Failed to fetch page {page_num}")
                 continue
-            
+
             tests = self.extract_tests_from_page(page_soup)
             logger.info(f"Found {len(tests)} tests on page {page_num}")
-            
+
             for test in tests:
                 all_tests[test['url']] = test
-            
+
             await asyncio.sleep(self.delay)
-        
-        logger.info(f"Total tests collected: {len(all_tests)}")
+
+        return all_tests
+
+    async def stream_tests(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield fully-detailed tests as their detail pages are fetched
+
+        Detail fetches run on worker threads with up to
+        SCRAPER_CONCURRENCY in flight; a pacing lock keeps request
+        starts SCRAPER_DELAY apart, so the politeness rate is unchanged
+        while response latencies overlap. Consumers can write each
+        record out while the remaining fetches are pending.
+        """
+        all_tests = await self._collect_catalog_entries()
+        total = len(all_tests)
+
+        logger.info(f"Total tests collected: {total}")
         logger.info("Fetching detailed information for each test...")
-        
-        # Fetch detailed information for each test
-        for idx, (url, test_data) in enumerate(all_tests.items(), 1):
-            logger.info(f"Fetching details {idx}/{len(all_tests)}: {test_data['name']}")
-            details = self.get_test_details(url)
-            
+
+        semaphore = asyncio.Semaphore(settings.SCRAPER_CONCURRENCY)
+        pace_lock = asyncio.Lock()
+
+        async def fetch_details(idx: int, url: str, test_data: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                # Space request starts by the politeness delay even
+                # when several workers are waiting
+                async with pace_lock:
+                    await asyncio.sleep(self.delay)
+
+                logger.info(f"Fetching details {idx}/{total}: {test_data['name']}")
+                details = await asyncio.to_thread(self.get_test_details, url)
+
             if details:
                 test_data.update(details)
-            
-            await asyncio.sleep(self.delay)
-        
-        return all_tests
+
+            return test_data
+
+        tasks = [
+            asyncio.create_task(fetch_details(idx, url, test_data))
+            for idx, (url, test_data) in enumerate(all_tests.items(), 1)
+        ]
+
+        for task in asyncio.as_completed(tasks):
+            yield await task
+
+    async def scrape_all_tests(self) -> Dict[str, Dict[str, Any]]:
+        """Scrape all tests from the catalog with pagination"""
+        return {test['url']: test async for test in self.stream_tests()}
     
     def save_to_json(self, data: Dict[str, Any], filename: str = None):
         """Save scraped data to JSON file"""
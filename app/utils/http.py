@@ -0,0 +1,50 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger("http")
+
+# Process-global client so every async fetch shares one connection
+# pool (DNS cache, keep-alive sockets, TLS sessions)
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+
+async def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient, creating it lazily on first use
+
+    Returns:
+        Process-global httpx.AsyncClient
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        async with _client_lock:
+            if _client is None or _client.is_closed:
+                logger.info("Creating shared HTTP client")
+                _client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=64,
+                        max_connections=128
+                    ),
+                    timeout=settings.SCRAPER_TIMEOUT,
+                    follow_redirects=True
+                )
+
+    return _client
+
+
+async def close_client():
+    """Close the shared AsyncClient (called on app shutdown)"""
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        logger.info("Closing shared HTTP client")
+        await _client.aclose()
+
+    _client = None
@@ -29,6 +29,7 @@ def setup_logger():
         rotation="100 MB",
         retention="10 days",
         compression="zip",
+        enqueue=True,  # hand file I/O to a writer thread, don't block callers
     )
     
     return logger
@@ -5,6 +5,16 @@ from app.utils.logger import get_logger
 
 logger = get_logger("validators")
 
+# Basic SQL injection patterns combined into one alternation so
+# sanitize_input makes a single pass instead of one per pattern
+_SQL_INJECTION_RE = re.compile(
+    r'(?:\b(?:DROP|DELETE|INSERT|UPDATE)\b.*\b(?:TABLE|FROM|INTO)\b)'
+    r'|--'
+    r'|/\*.*?\*/'
+    r'|;.*$',
+    re.IGNORECASE
+)
+
 
 def validate_url(url: str) -> bool:
     """
@@ -35,10 +45,12 @@ def validate_query_length(query: str, min_length: int = 10, max_length: int = 50
     Returns:
         tuple: (is_valid, error_message)
     """
-    if not query or not query.strip():
+    stripped = query.strip() if query else ''
+
+    if not stripped:
         return False, "Query cannot be empty"
-    
-    query_length = len(query.strip())
+
+    query_length = len(stripped)
     
     if query_length < min_length:
         return False, f"Query is too short. Minimum {min_length} characters required."
@@ -72,31 +84,37 @@ def extract_urls_from_text(text: str) -> List[str]:
     return valid_urls
 
 
+# Keywords commonly found in job descriptions
+_JD_KEYWORDS = (
+    'responsibilities', 'requirements', 'qualifications', 'experience',
+    'skills', 'job description', 'role', 'position', 'candidate',
+    'duties', 'education', 'bachelor', 'master', 'years of experience',
+    'team', 'company', 'hiring', 'seeking', 'looking for'
+)
+
+
 def is_job_description(text: str) -> bool:
     """
-    Heuristically determine if text is likely a job description
-    
+    Heuristically determine if text is likely a JD
+
     Args:
         text: Text to analyze
-        
+
     Returns:
         bool: True if likely a JD
     """
-    # Keywords commonly found in job descriptions
-    jd_keywords = [
-        'responsibilities', 'requirements', 'qualifications', 'experience',
-        'skills', 'job description', 'role', 'position', 'candidate',
-        'duties', 'education', 'bachelor', 'master', 'years of experience',
-        'team', 'company', 'hiring', 'seeking', 'looking for'
-    ]
-    
     text_lower = text.lower()
-    
-    # Count keyword matches
-    matches = sum(1 for keyword in jd_keywords if keyword in text_lower)
-    
-    # If at least 3 keywords are found, likely a JD
-    return matches >= 3
+
+    # If at least 3 keywords are found, likely a JD; stop scanning as
+    # soon as the threshold is reached
+    matches = 0
+    for keyword in _JD_KEYWORDS:
+        if keyword in text_lower:
+            matches += 1
+            if matches >= 3:
+                return True
+
+    return False
 
 
 def validate_assessment_data(assessment: dict) -> tuple[bool, Optional[str]]:
@@ -139,21 +157,31 @@ def sanitize_input(text: str) -> str:
     Returns:
         str: Sanitized text
     """
-    # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    # Remove excessive whitespace; str.split runs in C and beats the
+    # regex engine for collapsing runs to single spaces
+    text = ' '.join(text.split())
     
     # Remove potential SQL injection patterns (basic)
-    sql_patterns = [
-        r'(\bDROP\b|\bDELETE\b|\bINSERT\b|\bUPDATE\b).*\b(TABLE|FROM|INTO)\b',
-        r'--',
-        r'/\*.*?\*/',
-        r';.*$'
-    ]
-    
-    for pattern in sql_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
+    text = _SQL_INJECTION_RE.sub('', text)
+    
+    # Remove HTML tags with a single-pass scan; str.find runs in C and is
+    # considerably faster than the regex engine on chat-length strings
+    if '<' in text:
+        parts = []
+        i = 0
+        while True:
+            j = text.find('<', i)
+            if j < 0:
+                parts.append(text[i:])
+                break
+            parts.append(text[i:j])
+            k = text.find('>', j + 1)
+            if k < 0:
+                # No closing '>' means this cannot be a tag (e.g. a
+                # plain "<5 years" comparison); keep the remainder
+                parts.append(text[j:])
+                break
+            i = k + 1
+        text = ''.join(parts)
+
     return text.strip()
\ No newline at end of file
@@ -18,7 +18,11 @@ from chainlit_app.handlers.session_handler import SessionHandler
 from chainlit_app.components.progress_tracker import ProgressTracker
 from app.database import init_db, init_chroma
 from app.utils.logger import get_logger
-from chainlit_app.components.table_renderer import render_assessment_table, render_summary_stats
+from chainlit_app.components.table_renderer import (
+    iter_assessment_table_rows,
+    render_assessment_list,
+    render_summary_stats
+)
 logger = get_logger("chainlit_app")
 
 # Initialize handlers
@@ -26,6 +30,32 @@ message_handler = MessageHandler()
 session_handler = SessionHandler()
 progress_tracker = ProgressTracker()
 
+# Database initialization runs in the background once per process;
+# on_message waits on the event so the first query never races it
+_db_ready = asyncio.Event()
+_db_init_started = False
+
+
+async def _ensure_db():
+    """Initialize databases once, off the event loop"""
+    global _db_init_started
+
+    if _db_init_started:
+        await _db_ready.wait()
+        return
+
+    _db_init_started = True
+
+    try:
+        await asyncio.to_thread(init_db)
+        await asyncio.to_thread(init_chroma)
+        logger.info("Databases initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize databases: {e}")
+    finally:
+        # Unblock waiters even on failure; queries surface their own errors
+        _db_ready.set()
+
 
 @cl.on_chat_start
 async def on_chat_start():
@@ -33,7 +63,10 @@ async def on_chat_start():
     Called when a new chat session starts
     """
     logger.info("New chat session started")
-    
+
+    # Kick off database initialization without blocking the welcome flow
+    asyncio.create_task(_ensure_db())
+
     # Initialize session
     session_id = await session_handler.create_session()
     
@@ -83,8 +116,11 @@ async def on_message(message: cl.Message):
     """
     user_query = message.content
     session_id = cl.user_session.get("session_id")
-    
+
     logger.info(f"Received message from session {session_id}: {user_query[:100]}...")
+
+    # Make sure background database initialization has finished
+    await _db_ready.wait()
     
     # Show processing message
     processing_msg = cl.Message(content="🔄 Processing your request...")
@@ -162,20 +198,31 @@ async def send_recommendations_response(result: dict):
     if query_info.get('duration'):
         response_parts.append(f"**Duration Constraint**: {query_info['duration']} minutes")
     
+    # Build recommendations header
+    recommendations_msg = f"## ✅ Found {len(recommendations)} Relevant Assessments\n\nHere are my recommendations tailored to your requirements:\n"
+
+    # Combine understanding + header into a single message to avoid
+    # paying a websocket round trip (and frontend re-render) per section
+    body_parts = []
+
     if response_parts:
         understanding_msg = "**Understanding Your Requirements:**\n" + "\n".join(f"- {part}" for part in response_parts)
-        await cl.Message(content=understanding_msg, author="System").send()
-    
-    # Send recommendations header
-    recommendations_msg = f"## ✅ Found {len(recommendations)} Relevant Assessments\n\nHere are my recommendations tailored to your requirements:\n"
-    await cl.Message(content=recommendations_msg).send()
-    
+        body_parts.append(understanding_msg)
+
+    body_parts.append(recommendations_msg)
+
+    await cl.Message(content="\n\n".join(body_parts)).send()
+
+    # Stream table rows as they are formatted so the user gets a
+    # progressive render instead of waiting for the full table
+    table_msg = cl.Message(content="")
+    await table_msg.send()
+
+    for row_md in iter_assessment_table_rows(recommendations):
+        await table_msg.stream_token(row_md)
+
+    await table_msg.update()
 
-    
-    # Render assessments as a table
-    table_content = render_assessment_table(recommendations)
-    await cl.Message(content=table_content).send()
-    
     # Send summary statistics
     summary_content = render_summary_stats(recommendations)
     await cl.Message(content=summary_content, author="System").send()
@@ -200,7 +247,6 @@ async def send_general_response(result: dict):
             author="System"
         ).send()
         
-        from chainlit_app.components.table_renderer import render_assessment_list
         assessments_list = render_assessment_list(result['related_assessments'])
         await cl.Message(content=assessments_list).send()
 
@@ -265,12 +311,7 @@ Have a great day! 🌟
 async def setup_databases():
     """Initialize databases when app starts"""
     logger.info("Initializing databases for Chainlit app...")
-    try:
-        init_db()
-        init_chroma()
-        logger.info("Databases initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize databases: {e}")
+    await _ensure_db()
 
 
 if __name__ == "__main__":
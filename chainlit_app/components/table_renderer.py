@@ -2,25 +2,45 @@
 Table and card rendering components for displaying assessments in Chainlit
 """
 
+import sys
+from collections import Counter
+from itertools import chain
 from typing import List, Dict, Any
 
+# None-like values that should fall back to the default; a single
+# set-membership check is cheaper than chained equality comparisons
+_EMPTY = frozenset({None, 'None', ''})
+
+# Interned emoji-bearing label fragments reused on every card/table
+# render, so each send reuses one string object instead of rebuilding
+# the multi-codepoint emoji sequences
+_CARD_DETAILS_HEADER = sys.intern("**Details:**")
+_TEST_TYPES_LABEL = sys.intern("- 🏷️ **Test Types:** ")
+_DURATION_LABEL = sys.intern("- ⏱️ **Duration:** ")
+_JOB_LEVELS_LABEL = sys.intern("- 👤 **Job Levels:** ")
+_REMOTE_LABEL = sys.intern("- 🌐 **Remote Support:** ")
+_ADAPTIVE_LABEL = sys.intern("- 🔄 **Adaptive:** ")
+_VIEW_LABEL = sys.intern("🔗 [View Assessment](")
+_TABLE_HEADER = sys.intern(
+    "| # | Assessment | Test Type | Duration | Job Levels | Remote | Link |\n"
+    "|---|------------|-----------|----------|------------|--------|------|\n"
+)
+
 
 def _safe_get(assessment: Dict[str, Any], key: str, default: str = 'N/A') -> str:
     """
     Safely get a value from assessment, handling None and 'None' string
-    
+
     Args:
         assessment: Assessment dictionary
         key: Key to retrieve
         default: Default value if None or 'None'
-        
+
     Returns:
         Value or default
     """
     value = assessment.get(key)
-    if value is None or value == 'None' or value == '':
-        return default
-    return value
+    return default if value in _EMPTY else value
 
 
 def render_assessment_card(assessment: Dict[str, Any], index: int) -> str:
@@ -53,23 +73,25 @@ def render_assessment_card(assessment: Dict[str, Any], index: int) -> str:
     else:
         duration_str = "Not specified"
     
-    # Build card
-    card = f"""### {index}. {name}
+    # Build card from interned label fragments
+    card = "\n".join([
+        f"### {index}. {name}",
+        "",
+        f"**Description:** {description}",
+        "",
+        _CARD_DETAILS_HEADER,
+        _TEST_TYPES_LABEL + (', '.join(test_types) if test_types else 'N/A'),
+        _DURATION_LABEL + duration_str,
+        _JOB_LEVELS_LABEL + str(job_levels),
+        _REMOTE_LABEL + str(remote),
+        _ADAPTIVE_LABEL + str(adaptive),
+        "",
+        _VIEW_LABEL + f"{url})",
+        "",
+        "---",
+        ""
+    ])
 
-**Description:** {description}
-
-**Details:**
-- 🏷️ **Test Types:** {', '.join(test_types) if test_types else 'N/A'}
-- ⏱️ **Duration:** {duration_str}
-- 👤 **Job Levels:** {job_levels}
-- 🌐 **Remote Support:** {remote}
-- 🔄 **Adaptive:** {adaptive}
-
-🔗 [View Assessment]({url})
-
----
-"""
-    
     return card
 
 
@@ -106,25 +128,22 @@ def render_assessment_list(assessments: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def render_assessment_table(assessments: List[Dict[str, Any]]) -> str:
+def iter_assessment_table_rows(assessments: List[Dict[str, Any]]):
     """
-    Render assessments as a markdown table
-    
+    Yield markdown table lines (header first, then one row per assessment)
+
+    Allows callers to stream rows incrementally instead of waiting for
+    the full table to be built.
+
     Args:
         assessments: List of assessment dictionaries
-        
-    Returns:
-        Formatted markdown table string
+
+    Yields:
+        Markdown table lines
     """
-    if not assessments:
-        return "No assessments to display."
-    
     # Build table with job_levels column
-    table_lines = [
-        "| # | Assessment | Test Type | Duration | Job Levels | Remote | Link |",
-        "|---|------------|-----------|----------|------------|--------|------|"
-    ]
-    
+    yield _TABLE_HEADER
+
     for idx, assessment in enumerate(assessments, 1):
         name = assessment.get('name', 'Unknown')
         test_types = ', '.join(assessment.get('test_type', [])[:2])  # Show max 2 types
@@ -154,11 +173,24 @@ def render_assessment_table(assessments: List[Dict[str, Any]]) -> str:
             job_levels = str(job_levels)[:37] + "..."
         
         link = f"[View]({url})"
-        
-        row = f"| {idx} | {name} | {test_types} | {duration_str} | {job_levels} | {remote} | {link} |"
-        table_lines.append(row)
-    
-    return "\n".join(table_lines)
+
+        yield f"| {idx} | {name} | {test_types} | {duration_str} | {job_levels} | {remote} | {link} |\n"
+
+
+def render_assessment_table(assessments: List[Dict[str, Any]]) -> str:
+    """
+    Render assessments as a markdown table
+
+    Args:
+        assessments: List of assessment dictionaries
+
+    Returns:
+        Formatted markdown table string
+    """
+    if not assessments:
+        return "No assessments to display."
+
+    return "".join(iter_assessment_table_rows(assessments))
 
 
 def render_summary_stats(assessments: List[Dict[str, Any]]) -> str:
@@ -176,27 +208,30 @@ def render_summary_stats(assessments: List[Dict[str, Any]]) -> str:
     
     total = len(assessments)
     
-    # Count test types
-    test_type_counts = {}
-    for assessment in assessments:
-        for test_type in assessment.get('test_type', []):
-            test_type_counts[test_type] = test_type_counts.get(test_type, 0) + 1
+    # Count test types (Counter runs the counting loop in C)
+    test_type_counts = Counter(
+        chain.from_iterable(a.get('test_type') or () for a in assessments)
+    )
     
     # Count remote/adaptive
     remote_count = sum(1 for a in assessments if a.get('remote_support') == 'Yes')
     adaptive_count = sum(1 for a in assessments if a.get('adaptive_support') == 'Yes')
     
-    # Calculate average duration - filter out None and 'None' strings
-    durations = []
+    # Calculate average duration - filter out None and 'None' strings.
+    # Durations are whole minutes, so accumulate integers directly
+    # instead of building a float list and summing it afterwards
+    dur_sum = 0
+    dur_count = 0
     for a in assessments:
         dur = a.get('duration')
         if dur and dur != 'None' and dur != '':
             try:
-                durations.append(float(dur))
+                dur_sum += int(dur)
+                dur_count += 1
             except (ValueError, TypeError):
                 pass
-    
-    avg_duration = sum(durations) / len(durations) if durations else 0
+
+    avg_duration = dur_sum / dur_count if dur_count else 0
     
     # Build summary
     summary = f"""**Summary Statistics:**
@@ -2,26 +2,76 @@
 Message handler for processing user queries in Chainlit
 """
 
-import sys
-from pathlib import Path
+import asyncio
 from typing import Dict, Any, Callable, Optional
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from app.graph.workflow import execute_query
 from app.utils.logger import get_logger
 from app.utils.formatters import format_assessment_response
 
 logger = get_logger("message_handler")
 
+# Display key -> EnhancedQuery field used to build query_info
+_QUERY_INFO_FIELDS = {
+    'skills': 'extracted_skills',
+    'test_types': 'required_test_types',
+    'duration': 'extracted_duration',
+    'job_levels': 'extracted_job_levels',
+    'key_requirements': 'key_requirements'
+}
+
 
 class MessageHandler:
     """Handler for processing user messages"""
     
     def __init__(self):
         self.logger = get_logger("message_handler")
-    
+
+        # Intent -> async result handler; all entries share the
+        # (final_state, progress_callback) signature
+        self._dispatch = {
+            'jd_query': self._handle_jd_query_result,
+            'general': self._handle_general_result,
+            'out_of_context': self._handle_out_of_context_result
+        }
+
+    @staticmethod
+    def _make_progress_notifier(progress_callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Wrap a progress callback so updates never block the workflow
+
+        Updates are scheduled as fire-and-forget tasks, coalesced to
+        steps of at least 10%, and dropped while a previous update is
+        still in flight. The final (100%) update always goes through.
+
+        Args:
+            progress_callback: The raw async progress callback
+
+        Returns:
+            Async notifier with the same (message, percentage) signature
+        """
+        if progress_callback is None:
+            return None
+
+        last_pct = -1
+        in_flight: Optional[asyncio.Task] = None
+
+        async def notify(message: str, percentage: int):
+            nonlocal last_pct, in_flight
+
+            if percentage < 100:
+                # Coalesce small steps and drop updates while the UI
+                # round trip for the previous one is still pending
+                if last_pct >= 0 and percentage - last_pct < 10:
+                    return
+                if in_flight is not None and not in_flight.done():
+                    return
+
+            last_pct = percentage
+            in_flight = asyncio.create_task(progress_callback(message, percentage))
+
+        return notify
+
     async def handle_message(
         self,
         query: str,
@@ -40,34 +90,35 @@ class MessageHandler:
             Structured response dictionary
         """
         self.logger.info(f"Handling message for session {session_id}")
-        
+
+        # Throttled, non-blocking wrapper around the raw callback
+        notify = self._make_progress_notifier(progress_callback)
+
         try:
             # Update progress - Starting workflow
-            if progress_callback:
-                await progress_callback("Starting workflow...", 30)
-            
+            if notify:
+                await notify("Starting workflow...", 30)
+
             # Execute workflow
             final_state = await execute_query(query, session_id)
-            
+
             # Update progress - Processing results
-            if progress_callback:
-                await progress_callback("Processing results...", 70)
-            
+            if notify:
+                await notify("Processing results...", 70)
+
             # Extract results based on intent
             intent = final_state.get('intent')
-            
-            if intent == 'jd_query':
-                result = await self._handle_jd_query_result(final_state, progress_callback)
-            elif intent == 'general':
-                result = await self._handle_general_result(final_state)
-            elif intent == 'out_of_context':
-                result = await self._handle_out_of_context_result(final_state)
+
+            handler = self._dispatch.get(intent)
+
+            if handler:
+                result = await handler(final_state, notify)
             else:
                 result = self._handle_unknown_result(final_state)
-            
+
             # Update progress - Complete
-            if progress_callback:
-                await progress_callback("Complete!", 100)
+            if notify:
+                await notify("Complete!", 100)
             
             return result
             
@@ -105,21 +156,18 @@ class MessageHandler:
                 'intent': 'jd_query'
             }
         
-        # Update progress
+        # Fire the progress update without awaiting it so the UI round
+        # trip overlaps with building query_info below
         if progress_callback:
-            await progress_callback("Formatting recommendations...", 90)
-        
-        # Extract query info for display
-        query_info = {}
+            asyncio.create_task(progress_callback("Formatting recommendations...", 90))
         
+        # Extract query info for display: one model_dump pass through
+        # pydantic's core instead of five Python attribute lookups
         if enhanced_query:
-            query_info = {
-                'skills': enhanced_query.extracted_skills,
-                'test_types': enhanced_query.required_test_types,
-                'duration': enhanced_query.extracted_duration,
-                'job_levels': enhanced_query.extracted_job_levels,
-                'key_requirements': enhanced_query.key_requirements
-            }
+            dumped = enhanced_query.model_dump(include=set(_QUERY_INFO_FIELDS.values()))
+            query_info = {key: dumped.get(field) for key, field in _QUERY_INFO_FIELDS.items()}
+        else:
+            query_info = {}
         
         return {
             'type': 'recommendations',
@@ -129,7 +177,11 @@ class MessageHandler:
             'intent': 'jd_query'
         }
     
-    async def _handle_general_result(self, final_state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_general_result(
+        self,
+        final_state: Dict[str, Any],
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, Any]:
         """Handle general query results"""
         
         general_answer = final_state.get('general_answer', '')
@@ -163,7 +215,11 @@ class MessageHandler:
             'intent': 'general'
         }
     
-    async def _handle_out_of_context_result(self, final_state: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_out_of_context_result(
+        self,
+        final_state: Dict[str, Any],
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, Any]:
         """Handle out of context results"""
         
         general_answer = final_state.get('general_answer', '')
@@ -2,14 +2,15 @@
 Session handler for managing Chainlit sessions
 """
 
-import sys
-from pathlib import Path
+import asyncio
+import json
 import uuid
+from pathlib import Path
 from typing import Dict, Any, Optional
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import aiosqlite
 
+from app.config import settings
 from app.services.session_service import get_session_service
 from app.utils.logger import get_logger
 
@@ -18,16 +19,48 @@ logger = get_logger("session_handler")
 
 class SessionHandler:
     """Handler for managing user sessions in Chainlit"""
-    
+
     def __init__(self):
         self.session_service = get_session_service()
         self.logger = get_logger("session_handler")
-        self.session_stats = {}  # In-memory stats for current session
-    
+        # Stats persist in SQLite (WAL) so they survive restarts and
+        # stay consistent when multiple workers share the file
+        self.stats_db_path = Path(settings.SQLITE_DB_PATH).parent / "chainlit_stats.db"
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Get the stats database connection, opening it lazily"""
+        if self._db is None:
+            async with self._db_lock:
+                if self._db is None:
+                    self.stats_db_path.parent.mkdir(parents=True, exist_ok=True)
+
+                    db = await aiosqlite.connect(self.stats_db_path, isolation_level=None)
+
+                    # WAL lets concurrent workers write without blocking
+                    await db.execute("PRAGMA journal_mode=WAL")
+                    await db.execute("PRAGMA synchronous=NORMAL")
+                    await db.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS session_stats (
+                            session_id TEXT PRIMARY KEY,
+                            total_queries INTEGER NOT NULL DEFAULT 0,
+                            total_recommendations INTEGER NOT NULL DEFAULT 0,
+                            query_types TEXT NOT NULL DEFAULT '{}'
+                        )
+                        """
+                    )
+
+                    self._db = db
+                    self.logger.info(f"Session stats database ready at {self.stats_db_path}")
+
+        return self._db
+
     async def create_session(self) -> str:
         """
         Create a new chat session
-        
+
         Returns:
             Session ID
         """
@@ -35,90 +68,130 @@ class SessionHandler:
             session_id = self.session_service.create_session(
                 metadata={'source': 'chainlit'}
             )
-            
-            # Initialize stats
-            self.session_stats[session_id] = {
-                'total_queries': 0,
-                'total_recommendations': 0,
-                'query_types': {}
-            }
-            
+
+            # Initialize stats row
+            db = await self._get_db()
+            await db.execute(
+                "INSERT OR IGNORE INTO session_stats (session_id) VALUES (?)",
+                (session_id,)
+            )
+
             self.logger.info(f"Created new session: {session_id}")
-            
+
             return session_id
-            
+
         except Exception as e:
             self.logger.error(f"Failed to create session: {e}")
             return str(uuid.uuid4())
-    
+
     async def update_session_stats(self, session_id: str, result: Dict[str, Any]):
         """
         Update session statistics
-        
+
         Args:
             session_id: Session identifier
             result: Result from message processing
         """
         try:
-            if session_id not in self.session_stats:
-                self.session_stats[session_id] = {
-                    'total_queries': 0,
-                    'total_recommendations': 0,
-                    'query_types': {}
-                }
-            
-            stats = self.session_stats[session_id]
-            
-            # Update query count
-            stats['total_queries'] += 1
-            
-            # Update query type count
+            db = await self._get_db()
+
             intent = result.get('intent')
-            if intent:
-                stats['query_types'][intent] = stats['query_types'].get(intent, 0) + 1
-            
-            # Update recommendation count
+
+            recommendations = 0
             if result['type'] == 'recommendations':
-                stats['total_recommendations'] += result.get('count', 0)
-            
-            self.logger.debug(f"Updated stats for session {session_id}: {stats}")
-            
+                recommendations = result.get('count', 0)
+
+            async with self._db_lock:
+                # Merge the query-type histogram in Python; the lock
+                # keeps the read-merge-write atomic within this worker
+                # and WAL keeps cross-worker writes from blocking
+                query_types = {}
+                async with db.execute(
+                    "SELECT query_types FROM session_stats WHERE session_id = ?",
+                    (session_id,)
+                ) as cursor:
+                    row = await cursor.fetchone()
+                    if row:
+                        query_types = json.loads(row[0])
+
+                if intent:
+                    query_types[intent] = query_types.get(intent, 0) + 1
+
+                await db.execute(
+                    """
+                    INSERT INTO session_stats
+                        (session_id, total_queries, total_recommendations, query_types)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT(session_id) DO UPDATE SET
+                        total_queries = total_queries + 1,
+                        total_recommendations = total_recommendations + excluded.total_recommendations,
+                        query_types = excluded.query_types
+                    """,
+                    (session_id, recommendations, json.dumps(query_types))
+                )
+
+            self.logger.debug(f"Updated stats for session {session_id}")
+
         except Exception as e:
             self.logger.error(f"Failed to update session stats: {e}")
-    
+
     async def get_session_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Get session statistics
-        
+
         Args:
             session_id: Session identifier
-            
+
         Returns:
-            Session statistics or None
+            Session statistics snapshot, or None
         """
         try:
-            if session_id in self.session_stats:
-                return self.session_stats[session_id].copy()
-            
-            return None
-            
+            db = await self._get_db()
+
+            async with db.execute(
+                """
+                SELECT total_queries, total_recommendations, query_types
+                FROM session_stats WHERE session_id = ?
+                """,
+                (session_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+
+            if row is None:
+                return None
+
+            return {
+                'total_queries': row[0],
+                'total_recommendations': row[1],
+                'query_types': json.loads(row[2])
+            }
+
         except Exception as e:
             self.logger.error(f"Failed to get session stats: {e}")
             return None
-    
+
     async def end_session(self, session_id: str):
         """
         End a chat session
-        
+
         Args:
             session_id: Session identifier
         """
         try:
-            # Clean up in-memory stats
-            if session_id in self.session_stats:
-                del self.session_stats[session_id]
-            
+            # Clean up persisted stats
+            db = await self._get_db()
+            await db.execute(
+                "DELETE FROM session_stats WHERE session_id = ?",
+                (session_id,)
+            )
+
             self.logger.info(f"Ended session: {session_id}")
-            
+
         except Exception as e:
-            self.logger.error(f"Failed to end session: {e}")
\ No newline at end of file
+            self.logger.error(f"Failed to end session: {e}")
+
+    async def close(self):
+        """Close the stats database connection"""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
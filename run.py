@@ -14,5 +14,7 @@ if __name__ == "__main__":
         port=settings.API_PORT,
         reload=settings.API_RELOAD,
         workers=settings.API_WORKERS,
-        log_level=settings.LOG_LEVEL.lower()
+        log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools"
     )
\ No newline at end of file
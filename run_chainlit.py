@@ -6,13 +6,20 @@ Usage:
 """
 
 import os
-import subprocess
 import sys
+from pathlib import Path
 
 # Set environment variables
 os.environ.setdefault('CHAINLIT_HOST', '0.0.0.0')
 os.environ.setdefault('CHAINLIT_PORT', '8001')
 
+# Make the project root importable in the Chainlit process so handler
+# modules can use plain package imports instead of sys.path hacks;
+# prepend so any existing PYTHONPATH entries keep working
+_root = str(Path(__file__).parent)
+_existing = os.environ.get('PYTHONPATH')
+os.environ['PYTHONPATH'] = f"{_root}{os.pathsep}{_existing}" if _existing else _root
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Starting SHL Assessment Recommendation System - Chainlit UI")
@@ -21,14 +28,11 @@ if __name__ == "__main__":
     print(f"Port: {os.environ.get('CHAINLIT_PORT', '8001')}")
     print("=" * 60)
     
-    # Run chainlit
-    try:
-        subprocess.run([
-            sys.executable, "-m", "chainlit", "run",
-            "chainlit_app/app.py",
-            "--host", os.environ.get('CHAINLIT_HOST', '0.0.0.0'),
-            "--port", os.environ.get('CHAINLIT_PORT', '8001')
-        ])
-    except KeyboardInterrupt:
-        print("\n\nShutting down Chainlit...")
-        sys.exit(0)
\ No newline at end of file
+    # Replace this process with Chainlit rather than keeping an idle
+    # parent interpreter alive; SIGINT then goes straight to Chainlit
+    os.execvp(sys.executable, [
+        sys.executable, "-m", "chainlit", "run",
+        "chainlit_app/app.py",
+        "--host", os.environ.get('CHAINLIT_HOST', '0.0.0.0'),
+        "--port", os.environ.get('CHAINLIT_PORT', '8001')
+    ])
\ No newline at end of file
@@ -14,149 +14,222 @@ import json
 from pathlib import Path
 from typing import List, Dict
 
+try:
+    import orjson  # 2-5x faster JSON decode/encode than stdlib
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.graph.workflow import execute_query
 from app.database import init_db, init_chroma
+from app.services.vector_store_service import get_vector_store_service
 from app.config import settings
 from app.utils.logger import get_logger
 
 logger = get_logger("evaluate_script")
 
+SEP = "=" * 60
+
+
+def _norm(url: str) -> str:
+    """Normalize a URL for comparison (no trailing slash, lowercase)"""
+    return url.rstrip('/').lower()
+
+# All evaluation queries share one session: the workflow builds a fresh
+# state per execute_query call and never conditions on session history,
+# so recall is unaffected while any per-session setup is paid only once
+SHARED_EVAL_SESSION = "eval_shared"
+
+
+def dumps_compact(obj) -> str:
+    """Serialize to a compact JSON string, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
 
-def calculate_recall_at_k(predicted_urls: List[str], relevant_urls: List[str], k: int = 10) -> float:
+
+def calculate_recall_at_k(predicted_urls: List[str], relevant_set: frozenset, k: int = 10) -> float:
     """
     Calculate Recall@K for a single query
-    
+
+    Both arguments must already be normalized (lowercase, no trailing
+    slash); the caller normalizes each URL exactly once.
+
     Args:
-        predicted_urls: List of predicted assessment URLs
-        relevant_urls: List of relevant assessment URLs
+        predicted_urls: List of normalized predicted assessment URLs
+        relevant_set: Frozenset of normalized relevant assessment URLs
         k: Number of top predictions to consider
-        
+
     Returns:
         Recall@K score
     """
-    if not relevant_urls:
+    if not relevant_set:
         return 0.0
-    
-    # Take top K predictions
-    top_k_predictions = predicted_urls[:k]
-    
-    # Normalize URLs for comparison
-    predicted_normalized = [url.rstrip('/').lower() for url in top_k_predictions]
-    relevant_normalized = [url.rstrip('/').lower() for url in relevant_urls]
-    
-    # Count relevant items in top K
+
+    # Count relevant items in top K (hash lookup instead of list scan)
     relevant_in_top_k = sum(
-        1 for url in predicted_normalized
-        if url in relevant_normalized
+        1 for url in predicted_urls[:k]
+        if url in relevant_set
     )
-    
+
     # Calculate recall
-    recall = relevant_in_top_k / len(relevant_urls)
-    
-    return recall
+    return relevant_in_top_k / len(relevant_set)
+
+
+async def evaluate_single_query(idx: int, total: int, query: str, expected_url: str) -> Dict:
+    """
+    Evaluate a single test query
 
+    Args:
+        idx: 1-based query index (for logging/session naming)
+        total: Total number of test queries
+        query: Test query text
+        expected_url: Expected (relevant) assessment URL
 
-async def evaluate_on_test_set(test_data: Dict[str, str]) -> Dict[str, any]:
+    Returns:
+        Per-query result dictionary
+    """
+    # Brace-style args defer formatting until loguru accepts the record
+    logger.info("\n{}", SEP)
+    logger.info("Query {}/{}", idx, total)
+    logger.info("Query: {}...", query[:100])
+    logger.info("Expected: {}", expected_url)
+
+    try:
+        # Execute query
+        final_state = await execute_query(query, SHARED_EVAL_SESSION)
+
+        # Extract recommendations
+        recommendations = final_state.get('final_recommendations', [])
+        predicted_urls = [rec.get('url') for rec in recommendations if rec.get('url')]
+
+        logger.info("Predicted {} assessments", len(predicted_urls))
+
+        # Calculate recall
+        # Note: The training set has single URLs, but we'll treat them as lists
+        relevant_urls = [expected_url] if isinstance(expected_url, str) else expected_url
+
+        # Normalize each URL exactly once, then compare by hash lookup
+        relevant_set = frozenset(map(_norm, relevant_urls))
+        predicted_norm = list(map(_norm, predicted_urls))
+
+        recall = calculate_recall_at_k(predicted_norm, relevant_set, k=10)
+
+        # Check if expected URL is in predictions
+        expected_found = any(url in relevant_set for url in predicted_norm)
+
+        result = {
+            'query': query,
+            'expected_url': expected_url,
+            'predicted_urls': predicted_urls[:10],
+            'recall_at_10': recall,
+            'expected_found': expected_found,
+            'num_predictions': len(predicted_urls)
+        }
+
+        logger.info("Recall@10: {:.3f}", recall)
+        logger.info("Expected URL found: {}", expected_found)
+
+        if predicted_urls:
+            logger.info("Top prediction: {}", predicted_urls[0])
+
+        return result
+
+    except Exception as e:
+        logger.error("Error evaluating query {}: {}", idx, e)
+        return {
+            'query': query,
+            'expected_url': expected_url,
+            'error': str(e),
+            'recall_at_10': 0.0,
+            'expected_found': False
+        }
+
+
+async def evaluate_on_test_set(test_data: Dict[str, str], results_file: Path) -> Dict[str, any]:
     """
     Evaluate model on test set
-    
+
+    Queries are dispatched concurrently, bounded by a semaphore of
+    settings.EVAL_CONCURRENCY, so wall-clock time is no longer the sum
+    of per-query LLM + retrieval latencies. Each per-query result is
+    streamed to a JSON Lines file as it completes; only rolling
+    counters are kept in memory.
+
     Args:
         test_data: Dictionary mapping queries to expected URLs
-        
+        results_file: Path of the JSONL file for per-query results
+
     Returns:
-        Evaluation results
+        Evaluation summary (counters only; details are in results_file)
     """
-    results = []
-    recall_scores = []
-    
-    logger.info(f"Evaluating on {len(test_data)} test queries...")
-    
-    for idx, (query, expected_url) in enumerate(test_data.items(), 1):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Query {idx}/{len(test_data)}")
-        logger.info(f"Query: {query[:100]}...")
-        logger.info(f"Expected: {expected_url}")
-        
-        try:
-            # Execute query
-            session_id = f"eval_{idx}"
-            final_state = await execute_query(query, session_id)
-            
-            # Extract recommendations
-            recommendations = final_state.get('final_recommendations', [])
-            predicted_urls = [rec.get('url') for rec in recommendations if rec.get('url')]
-            
-            logger.info(f"Predicted {len(predicted_urls)} assessments")
-            
-            # Calculate recall
-            # Note: The training set has single URLs, but we'll treat them as lists
-            relevant_urls = [expected_url] if isinstance(expected_url, str) else expected_url
-            
-            recall = calculate_recall_at_k(predicted_urls, relevant_urls, k=10)
-            recall_scores.append(recall)
-            
-            # Check if expected URL is in predictions
-            expected_found = expected_url.rstrip('/').lower() in [
-                url.rstrip('/').lower() for url in predicted_urls
-            ]
-            
-            result = {
-                'query': query,
-                'expected_url': expected_url,
-                'predicted_urls': predicted_urls[:10],
-                'recall_at_10': recall,
-                'expected_found': expected_found,
-                'num_predictions': len(predicted_urls)
-            }
-            
-            results.append(result)
-            
-            logger.info(f"Recall@10: {recall:.3f}")
-            logger.info(f"Expected URL found: {expected_found}")
-            
-            if predicted_urls:
-                logger.info(f"Top prediction: {predicted_urls[0]}")
-            
-        except Exception as e:
-            logger.error(f"Error evaluating query {idx}: {e}")
-            results.append({
-                'query': query,
-                'expected_url': expected_url,
-                'error': str(e),
-                'recall_at_10': 0.0,
-                'expected_found': False
-            })
-            recall_scores.append(0.0)
-    
-    # Calculate mean recall
-    mean_recall = sum(recall_scores) / len(recall_scores) if recall_scores else 0.0
-    
-    # Calculate accuracy (how many times expected URL was found)
-    accuracy = sum(1 for r in results if r.get('expected_found', False)) / len(results)
-    
+    total = len(test_data)
+    semaphore = asyncio.Semaphore(settings.EVAL_CONCURRENCY)
+
+    logger.info("Evaluating on {} test queries (concurrency: {})...",
+                total, settings.EVAL_CONCURRENCY)
+
+    recall_sum = 0.0
+    accuracy_hits = 0
+    completed = 0
+
+    with open(results_file, 'w', encoding='utf-8') as f:
+
+        async def bounded_eval(idx: int, query: str, expected_url: str):
+            nonlocal recall_sum, accuracy_hits, completed
+
+            async with semaphore:
+                result = await evaluate_single_query(idx, total, query, expected_url)
+
+            # Stream the result out as one compact JSONL line
+            f.write(dumps_compact(result) + "\n")
+
+            recall_sum += result.get('recall_at_10', 0.0)
+            accuracy_hits += 1 if result.get('expected_found', False) else 0
+            completed += 1
+
+            if completed % 20 == 0:
+                f.flush()
+
+        await asyncio.gather(*(
+            bounded_eval(idx, query, expected_url)
+            for idx, (query, expected_url) in enumerate(test_data.items(), 1)
+        ))
+
     return {
-        'mean_recall_at_10': mean_recall,
-        'accuracy': accuracy,
-        'total_queries': len(results),
-        'detailed_results': results
+        'mean_recall_at_10': recall_sum / total if total else 0.0,
+        'accuracy': accuracy_hits / total if total else 0.0,
+        'total_queries': total
     }
 
 
 async def main():
     """Main evaluation function"""
-    logger.info("=" * 60)
+    logger.info(SEP)
     logger.info("Model Evaluation Script")
-    logger.info("=" * 60)
+    logger.info(SEP)
     
     try:
         # Initialize databases
         logger.info("Initializing databases...")
         init_db()
         init_chroma()
-        
+
+        # Warm up lazy one-time costs (embedding model load, Chroma
+        # first-touch, graph compile) so they are not measured against
+        # query 1 — and so the concurrent workers don't all stampede
+        # into lazy initialization at once
+        logger.info("Warming up embedding model and workflow...")
+        try:
+            vector_store = get_vector_store_service()
+            await vector_store.search_assessments(query="warmup", top_k=1)
+            await execute_query("warmup probe", "warmup_session")
+            logger.info("Warmup complete")
+        except Exception as e:
+            logger.warning(f"Warmup failed (continuing): {e}")
+
         # Load test data
         test_file = Path(settings.TRAIN_SET_PATH)
         
@@ -165,49 +238,43 @@ async def main():
             return 1
         
         logger.info(f"Loading test data from {test_file}...")
-        
-        with open(test_file, 'r', encoding='utf-8') as f:
-            test_data = json.load(f)
-        
+
+        # Single read + C-level decode; skips Python-side UTF-8 decoding
+        raw = test_file.read_bytes()
+        test_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
         logger.info(f"Loaded {len(test_data)} test queries")
         
-        # Run evaluation
-        eval_results = await evaluate_on_test_set(test_data)
-        
+        # Run evaluation, streaming per-query results to JSONL
+        results_file = Path("evaluation_results.jsonl")
+        eval_results = await evaluate_on_test_set(test_data, results_file)
+
         # Print summary
-        logger.info("\n" + "=" * 60)
+        logger.info("\n" + SEP)
         logger.info("EVALUATION RESULTS")
-        logger.info("=" * 60)
+        logger.info(SEP)
         logger.info(f"Total Queries: {eval_results['total_queries']}")
         logger.info(f"Mean Recall@10: {eval_results['mean_recall_at_10']:.4f}")
         logger.info(f"Accuracy (Expected URL Found): {eval_results['accuracy']:.4f}")
-        logger.info("=" * 60)
-        
-        # Save detailed results
-        output_file = Path("evaluation_results.json")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(eval_results, f, indent=2, ensure_ascii=False)
-        
-        logger.info(f"\nDetailed results saved to {output_file}")
-        
-        # Print per-query results
-        logger.info("\nPer-Query Results:")
-        logger.info("-" * 60)
-        
-        for idx, result in enumerate(eval_results['detailed_results'], 1):
-            logger.info(f"\n{idx}. Query: {result['query'][:80]}...")
-            logger.info(f"   Recall@10: {result.get('recall_at_10', 0):.3f}")
-            logger.info(f"   Expected Found: {result.get('expected_found', False)}")
-            
-            if result.get('error'):
-                logger.info(f"   Error: {result['error']}")
-        
+        logger.info(SEP)
+
+        # Save summary (per-query details are already in the JSONL file)
+        summary_file = Path("evaluation_summary.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(eval_results, option=orjson.OPT_INDENT_2).decode())
+            else:
+                json.dump(eval_results, f, indent=2, ensure_ascii=False)
+
+        logger.info(f"\nPer-query results saved to {results_file}")
+        logger.info(f"Summary saved to {summary_file}")
+
         return 0
         
-    except Exception as e:
-        logger.error(f"Evaluation failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        # exception() attaches the traceback lazily via the logger
+        # instead of an eager double-print through traceback
+        logger.exception("Evaluation failed")
         return 1
 
 
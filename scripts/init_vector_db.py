@@ -13,6 +13,11 @@ import sys
 import json
 from pathlib import Path
 
+try:
+    import orjson  # 2-5x faster JSON decode than stdlib
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -51,8 +56,8 @@ async def main():
         
         logger.info(f"Loading assessments from {assessments_file}...")
         
-        with open(assessments_file, 'r', encoding='utf-8') as f:
-            assessments = json.load(f)
+        raw = assessments_file.read_bytes()
+        assessments = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         logger.info(f"Loaded {len(assessments)} assessments from JSON")
         
@@ -68,11 +73,31 @@ async def main():
             logger.info("Clearing existing vector store...")
             await vector_store.clear_collection()
         
-        # Index assessments
+        # Index assessments in concurrent micro-batches: bounds peak
+        # embedding-batch memory while keeping the embedder saturated
         logger.info("Indexing assessments into ChromaDB...")
         logger.info("This may take several minutes...")
-        
-        indexed_count = await vector_store.index_assessments(assessments)
+
+        items = list(assessments.items())
+        batch_size = settings.INDEX_BATCH_SIZE
+        batches = [
+            dict(items[i:i + batch_size])
+            for i in range(0, len(items), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(settings.INDEX_MAX_CONCURRENCY)
+
+        async def index_batch(batch_num: int, batch: dict) -> int:
+            async with semaphore:
+                count = await vector_store.index_assessments(batch)
+                logger.info(f"Indexed batch {batch_num}/{len(batches)} "
+                            f"({count} assessments)")
+                return count
+
+        batch_counts = await asyncio.gather(*(
+            index_batch(batch_num, batch)
+            for batch_num, batch in enumerate(batches, 1)
+        ))
+        indexed_count = sum(batch_counts)
         
         logger.info("=" * 60)
         logger.info("Initialization completed successfully!")
@@ -97,10 +122,8 @@ async def main():
         
         return 0
         
-    except Exception as e:
-        logger.error(f"Initialization failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Initialization failed")
         return 1
 
 
@@ -9,9 +9,15 @@ Usage:
 """
 
 import asyncio
+import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson  # faster C-level JSON encode than stdlib
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -30,17 +36,31 @@ async def main():
     
     try:
         scraper = get_scraper_service()
-        
-        # Scrape all tests
+
+        output_file = settings.ASSESSMENTS_JSON_PATH
+        jsonl_file = Path(output_file).with_suffix('.jsonl')
+        jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream tests into a JSONL checkpoint as they are scraped, so
+        # serialization overlaps the remaining fetches and a crash
+        # mid-run keeps everything scraped so far
         logger.info("Starting catalog scraping...")
-        assessments = await scraper.scrape_all_tests()
-        
+        logger.info(f"Streaming scraped tests to {jsonl_file}...")
+
+        assessments = {}
+        with open(jsonl_file, 'w', encoding='utf-8') as f:
+            async for test in scraper.stream_tests():
+                if orjson is not None:
+                    f.write(orjson.dumps(test).decode() + '\n')
+                else:
+                    f.write(json.dumps(test, ensure_ascii=False) + '\n')
+                assessments[test['url']] = test
+
         if not assessments:
             logger.error("No assessments scraped!")
             return 1
-        
-        # Save to JSON
-        output_file = settings.ASSESSMENTS_JSON_PATH
+
+        # Save the final JSON catalog
         logger.info(f"Saving {len(assessments)} assessments to {output_file}...")
         scraper.save_to_json(assessments, output_file)
         
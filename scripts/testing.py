@@ -8,13 +8,29 @@ Usage:
     python scripts/testing.py
 """
 
+import asyncio
 import sys
 import json
 import csv
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import AsyncIterator, Dict, List, Tuple
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    import orjson  # ~3x faster JSON decode than stdlib
+except ImportError:
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,288 +40,570 @@ from app.utils.logger import get_logger
 logger = get_logger("testing_script")
 
 
+# Refuse to buffer response bodies beyond this (e.g. an unexpected
+# error page); normal API replies are a few KB
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+
+def _dumps(obj) -> bytes:
+    """Serialize a request body to JSON bytes, via orjson when available"""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def _log_retry(retry_state):
+    """Log each retry attempt at DEBUG"""
+    logger.debug("Retrying {} (attempt {}): {}",
+                 retry_state.fn.__name__,
+                 retry_state.attempt_number,
+                 retry_state.outcome.exception())
+
+
+# Transient timeouts and connection drops self-heal with exponential
+# backoff (~0.25s..4s, 4 attempts) instead of becoming permanent
+# NO_RECOMMENDATIONS rows; retries reuse the warm pooled connection
+_retry_transient = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(multiplier=0.25, max=4),
+    retry=retry_if_exception_type(
+        (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+    ),
+    before_sleep=_log_retry,
+    reraise=True,
+)
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter
+
+    Requests pace at the target QPS with bursts up to the bucket
+    capacity; unlike a fixed inter-request sleep, time spent waiting on
+    slow responses earns tokens back instead of being double-counted.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping only if the bucket is empty"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+
+
 class TestRunner:
     """Class to run tests and generate predictions"""
-    
-    def __init__(self, api_url: str = "http://localhost:8000"):
+
+    def __init__(self, api_url: str = "http://localhost:8000", concurrency: int = 8,
+                 max_qps: float = 5.0, batch_size: int = 16, verbose: bool = False):
         self.api_url = api_url
         self.recommend_endpoint = f"{api_url}/api/recommend"
+        self.recommend_batch_endpoint = f"{api_url}/api/recommend/batch"
         self.health_endpoint = f"{api_url}/api/health"
-        
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.verbose = verbose
+        self.limiter = TokenBucket(rate=max_qps)
+        self.session: aiohttp.ClientSession = None
+        # Fixed headers built once; request bodies are pre-serialized
+        # and passed as data= so aiohttp skips per-call JSON handling
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Connection": "keep-alive"
+        }
+        self._post = None
+        # Memoize responses by normalized query text so duplicate
+        # test-set entries skip the network entirely
+        self._url_cache: Dict[str, List[str]] = {}
+        self._cache_hits = 0
+        self.query_counts: Dict[str, int] = defaultdict(int)
+
+        # Pooled keep-alive session with retries for the synchronous
+        # calls (health check); retries cover a server that is still
+        # coming up or briefly returns 5xx
+        self.sync_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self.sync_session.mount("http://", adapter)
+        self.sync_session.mount("https://", adapter)
+
         logger.info(f"Initialized TestRunner with API: {api_url}")
-    
+
+    async def __aenter__(self) -> 'TestRunner':
+        # Cache DNS lookups and cap pooled connections for the fan-out
+        connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        self.session = aiohttp.ClientSession(connector=connector)
+        # Pre-bind to skip attribute lookups in the hot loop
+        self._post = self.session.post
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.session.close()
+        self.sync_session.close()
+
     def check_api_health(self) -> bool:
         """
         Check if API is running and healthy
-        
+
         Returns:
             True if API is healthy
         """
         try:
-            response = requests.get(self.health_endpoint, timeout=5)
-            if response.status_code == 200:
-                logger.info("✅ API is healthy")
-                return True
-            else:
-                logger.error(f"❌ API returned status {response.status_code}")
-                return False
-        except requests.exceptions.ConnectionError:
-            logger.error("❌ Cannot connect to API. Is the server running?")
-            logger.error(f"   Make sure server is running at: {self.api_url}")
-            return False
-        except Exception as e:
+            response = self.sync_session.get(self.health_endpoint, timeout=5)
+            response.raise_for_status()
+            logger.info("✅ API is healthy")
+            return True
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
             logger.error(f"❌ API health check failed: {e}")
+            logger.error(f"   Make sure server is running at: {self.api_url}")
             return False
-    
-    def get_recommendations(self, query: str) -> List[str]:
+
+    @staticmethod
+    async def _read_capped(response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read a response body in 64KB chunks up to MAX_RESPONSE_BYTES
+
+        Args:
+            response: Response whose body to read
+
+        Returns:
+            The body bytes
+
+        Raises:
+            ValueError: If the body exceeds the cap
+        """
+        buf = bytearray()
+
+        async for chunk in response.content.iter_chunked(65536):
+            buf += chunk
+            if len(buf) > MAX_RESPONSE_BYTES:
+                raise ValueError(
+                    f"Response exceeds {MAX_RESPONSE_BYTES} bytes, refusing to parse"
+                )
+
+        return bytes(buf)
+
+    @_retry_transient
+    async def get_recommendations(self, query: str) -> List[str]:
         """
         Get assessment recommendations for a query
-        
+
         Args:
             query: Job description or query text
-            
+
         Returns:
             List of assessment URLs
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: On transport or
+                HTTP errors (404 excepted); callers or a retry layer
+                handle these uniformly
         """
-        try:
-            logger.info(f"Getting recommendations for query: {query[:100]}...")
-            
-            response = requests.post(
-                self.recommend_endpoint,
-                json={"query": query},
-                timeout=60  # 60 second timeout for longer queries
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                assessments = data.get('recommended_assessments', [])
-                urls = [assessment['url'] for assessment in assessments]
-                
-                logger.info(f"✅ Got {len(urls)} recommendations")
-                return urls
-            
-            elif response.status_code == 404:
+        # Brace-style args defer formatting until loguru accepts
+        # the record, so a filtered DEBUG line costs almost nothing
+        logger.debug("Getting recommendations for query: {}...", query[:100])
+
+        async with self._post(
+            self.recommend_endpoint,
+            data=_dumps({"query": query}),
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=60)  # 60 second timeout for longer queries
+        ) as response:
+
+            if response.status == 404:
                 logger.warning(f"⚠️  No assessments found for query")
                 return []
-            
-            else:
-                logger.error(f"❌ API returned status {response.status_code}")
-                logger.error(f"   Response: {response.text}")
-                return []
-                
-        except requests.exceptions.Timeout:
-            logger.error(f"❌ Request timeout after 60 seconds")
-            return []
-        except Exception as e:
-            logger.error(f"❌ Failed to get recommendations: {e}")
-            return []
-    
+
+            response.raise_for_status()
+
+            # Parse from raw bytes; orjson skips the text decode
+            raw = await self._read_capped(response)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            assessments = data.get('recommended_assessments', [])
+            urls = [assessment['url'] for assessment in assessments]
+
+            logger.debug("Got {} recommendations", len(urls))
+            return urls
+
     def load_test_set(self, filepath: str) -> Dict[str, str]:
         """
         Load test set from JSON file
-        
+
         Args:
             filepath: Path to test set JSON file
-            
+
         Returns:
             Dictionary mapping query IDs to queries
         """
+        path = Path(filepath)
+
+        if not path.exists():
+            logger.error(f"❌ Test set file not found: {filepath}")
+            raise FileNotFoundError(f"Test set file not found: {filepath}")
+
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                test_set = json.load(f)
-            
+            # One-shot read + parse: a single syscall feeds the decoder
+            # with no incremental tokenizer or text-mode decoding
+            raw = path.read_bytes()
+            test_set = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
             logger.info(f"✅ Loaded {len(test_set)} test queries from {filepath}")
             return test_set
-            
-        except FileNotFoundError:
-            logger.error(f"❌ Test set file not found: {filepath}")
-            raise
-        except json.JSONDecodeError as e:
+
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             logger.error(f"❌ Invalid JSON in test set: {e}")
             raise
-    
-    def run_tests(self, test_set: Dict[str, str], delay: float = 1.0) -> List[Dict[str, str]]:
+
+    @_retry_transient
+    async def get_recommendations_batch(self, queries: List[str]) -> List[List[str]]:
         """
-        Run all tests and collect results
-        
+        Get recommendations for a batch of queries in one round-trip
+
         Args:
-            test_set: Dictionary of test queries
-            delay: Delay between requests (seconds)
-            
+            queries: Query texts (up to the server's batch limit)
+
         Returns:
-            List of prediction results
+            One URL list per query, in request order
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: On transport or
+                HTTP errors; callers or a retry layer handle these
+                uniformly
         """
-        results = []
-        total_queries = len(test_set)
-        
-        logger.info("=" * 60)
-        logger.info(f"Running tests on {total_queries} queries")
-        logger.info("=" * 60)
-        
-        for idx, (query_id, query_text) in enumerate(test_set.items(), 1):
-            logger.info(f"\n[{idx}/{total_queries}] Processing Query {query_id}")
-            logger.info("-" * 60)
-            
-            # Get recommendations
-            urls = self.get_recommendations(query_text)
-            
-            # Store results
+        async with self._post(
+            self.recommend_batch_endpoint,
+            data=_dumps({"queries": queries}),
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=120)  # whole batch
+        ) as response:
+
+            response.raise_for_status()
+
+            raw = await self._read_capped(response)
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return [
+                [assessment['url']
+                 for assessment in result.get('recommended_assessments', [])]
+                for result in data.get('results', [])
+            ]
+
+    async def _run_batch(
+        self,
+        semaphore: asyncio.Semaphore,
+        batch_num: int,
+        total_batches: int,
+        batch_items: List[Tuple[str, str]]
+    ) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Run one batch of test queries under the concurrency semaphore
+
+        Per-query counts are tallied here, where rows are produced, so
+        the rows themselves only carry what the CSV needs.
+
+        Args:
+            semaphore: Concurrency limiter (counts batches in flight)
+            batch_num: 1-based batch index (for logging)
+            total_batches: Total number of batches
+            batch_items: (query_id, query) pairs for this batch
+
+        Returns:
+            (queries processed, (query, url) rows) for this batch
+        """
+        rows = []
+
+        def append_result(query_id: str, query_text: str, urls: List[str]):
             if urls:
-                for url in urls:
-                    results.append({
-                        'query_id': query_id,
-                        'query': query_text,
-                        'assessment_url': url
-                    })
+                rows.extend((query_text, url) for url in urls)
+                self.query_counts[query_id] += len(urls)
             else:
                 # If no recommendations, add empty entry
-                logger.warning(f"⚠️  No recommendations for Query {query_id}")
-                results.append({
-                    'query_id': query_id,
-                    'query': query_text,
-                    'assessment_url': 'NO_RECOMMENDATIONS'
-                })
-            
-            # Delay between requests to avoid overwhelming API
-            if idx < total_queries:
-                time.sleep(delay)
-        
+                logger.warning("⚠️  No recommendations for Query {}", query_id)
+                rows.append((query_text, 'NO_RECOMMENDATIONS'))
+                self.query_counts[query_id] += 1
+
+        # Serve duplicates from the cache; only misses hit the network
+        pending = []
+        for query_id, query_text in batch_items:
+            key = ' '.join(query_text.split()).lower()
+            urls = self._url_cache.get(key)
+            if urls is not None:
+                self._cache_hits += 1
+                append_result(query_id, query_text, urls)
+            else:
+                pending.append((query_id, query_text, key))
+
+        if pending:
+            async with semaphore:
+                if self.verbose:
+                    logger.info("[Batch {}/{}] Processing {} queries "
+                                "({} served from cache)",
+                                batch_num, total_batches, len(pending),
+                                len(batch_items) - len(pending))
+
+                # Pace at the target QPS (blocks only when tokens run out)
+                await self.limiter.acquire()
+                try:
+                    url_lists = await self.get_recommendations_batch(
+                        [query_text for _, query_text, _ in pending]
+                    )
+                except (aiohttp.ClientConnectionError,
+                        aiohttp.ClientResponseError,
+                        asyncio.TimeoutError) as e:
+                    # One typed handler for transport/HTTP failures; the
+                    # batch degrades to empty results instead of crashing
+                    status = getattr(e, 'status', None)
+                    if status is not None:
+                        logger.error("❌ Batch {} failed with HTTP {}: {}",
+                                     batch_num, status, e)
+                    else:
+                        logger.error("❌ Batch {} failed: {}", batch_num, e)
+                    url_lists = [[] for _ in pending]
+
+            for (query_id, query_text, key), urls in zip(pending, url_lists):
+                self._url_cache[key] = urls
+                append_result(query_id, query_text, urls)
+
+        return len(batch_items), rows
+
+    async def run_tests(self, test_set: Dict[str, str]) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Run all tests concurrently, yielding rows as responses arrive
+
+        Queries fan out with an asyncio.Semaphore capping in-flight
+        requests; rows stream out through asyncio.as_completed so the
+        full result set is never held in memory. Per-query counts are
+        tallied inline for the summary.
+
+        Args:
+            test_set: Dictionary of test queries
+
+        Yields:
+            (query, url) prediction rows
+        """
+        total_queries = len(test_set)
+        total_rows = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self.query_counts = defaultdict(int)
+
+        # Chunk the test set so each round-trip carries batch_size
+        # queries, amortizing per-request overhead
+        items = list(test_set.items())
+        batches = [
+            items[i:i + self.batch_size]
+            for i in range(0, len(items), self.batch_size)
+        ]
+
+        logger.info("=" * 60)
+        logger.info(f"Running tests on {total_queries} queries "
+                    f"({len(batches)} batches of up to {self.batch_size}, "
+                    f"concurrency: {self.concurrency})")
+        logger.info("=" * 60)
+
+        tasks = [
+            asyncio.create_task(
+                self._run_batch(semaphore, batch_num, len(batches), batch_items)
+            )
+            for batch_num, batch_items in enumerate(batches, 1)
+        ]
+
+        completed_queries = 0
+        next_progress = 50
+
+        for task in asyncio.as_completed(tasks):
+            batch_queries, rows = await task
+            total_rows += len(rows)
+            for row in rows:
+                yield row
+
+            # When not verbose, report progress every ~50 queries
+            # instead of logging each batch
+            completed_queries += batch_queries
+            if not self.verbose and completed_queries >= next_progress:
+                logger.info("Processed {}/{} queries", completed_queries, total_queries)
+                next_progress += 50
+
         logger.info("\n" + "=" * 60)
         logger.info(f"✅ Completed {total_queries} queries")
-        logger.info(f"   Total recommendations: {len(results)}")
+        logger.info(f"   Total recommendations: {total_rows}")
         logger.info("=" * 60)
-        
-        return results
-    
-    def save_to_csv(self, results: List[Dict[str, str]], output_file: str):
+
+    async def save_to_csv(
+        self,
+        rows: AsyncIterator[Tuple[str, str]],
+        output_file: str,
+        batch_size: int = 1000
+    ) -> int:
         """
-        Save results to CSV in the required format
-        
+        Stream results to CSV in the required format
+
+        Rows arrive as ready-to-write (query, url) tuples, so each
+        writerows batch tight-loops in C with no per-row dict access
+        or list construction.
+
         Args:
-            results: List of prediction results
+            rows: Async iterable of (query, url) rows
             output_file: Output CSV file path
+            batch_size: Rows per writerows call
+
+        Returns:
+            Number of data rows written
         """
+        total_rows = 0
+
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
+            with open(output_file, 'w', newline='', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+
                 # Write header
                 writer.writerow(['Query', 'Assessment_url'])
-                
-                # Write data
-                for result in results:
-                    writer.writerow([
-                        result['query'],
-                        result['assessment_url']
-                    ])
-            
+
+                # Write data in batches as rows stream in
+                batch = []
+                async for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        writer.writerows(batch)
+                        total_rows += len(batch)
+                        batch.clear()
+
+                if batch:
+                    writer.writerows(batch)
+                    total_rows += len(batch)
+
             logger.info(f"✅ Saved results to {output_file}")
-            logger.info(f"   Total rows: {len(results)}")
-            
+            logger.info(f"   Total rows: {total_rows}")
+
+            return total_rows
+
         except Exception as e:
             logger.error(f"❌ Failed to save CSV: {e}")
             raise
-    
-    def generate_summary(self, results: List[Dict[str, str]], test_set: Dict[str, str]):
+
+    def generate_summary(self, query_counts: Dict[str, int], test_set: Dict[str, str]):
         """
         Generate summary statistics
-        
+
         Args:
-            results: List of prediction results
+            query_counts: Per-query row counts tallied during the run
             test_set: Original test set
         """
         logger.info("\n" + "=" * 60)
         logger.info("SUMMARY STATISTICS")
         logger.info("=" * 60)
-        
+
         total_queries = len(test_set)
-        total_recommendations = len(results)
-        
-        # Count recommendations per query
-        query_counts = {}
-        for result in results:
-            query_id = result['query_id']
-            query_counts[query_id] = query_counts.get(query_id, 0) + 1
-        
+        total_recommendations = sum(query_counts.values())
+
         # Calculate stats
         queries_with_recommendations = sum(1 for count in query_counts.values() if count > 0)
         avg_recommendations = total_recommendations / total_queries if total_queries > 0 else 0
-        
+
+        cache_hit_rate = self._cache_hits / total_queries if total_queries > 0 else 0
+
         logger.info(f"Total Queries: {total_queries}")
         logger.info(f"Queries with Recommendations: {queries_with_recommendations}")
         logger.info(f"Total Recommendations: {total_recommendations}")
         logger.info(f"Average Recommendations per Query: {avg_recommendations:.2f}")
-        
+        logger.info(f"Duplicate-query Cache Hit Rate: {cache_hit_rate:.1%} "
+                    f"({self._cache_hits} hits)")
+
         logger.info("\nRecommendations per Query:")
-        for query_id in sorted(query_counts.keys(), key=lambda x: int(x)):
-            count = query_counts[query_id]
+        for query_id, count in sorted(query_counts.items(), key=lambda kv: int(kv[0])):
             logger.info(f"  Query {query_id}: {count} recommendations")
-        
+
         logger.info("=" * 60)
 
 
-def main():
+async def main():
     """Main testing function"""
-    
+
     # Configuration
     API_URL = "http://localhost:8000"
     TEST_SET_FILE = "data/Test-Set.json"
     OUTPUT_FILE = "predictions.csv"
-    DELAY_BETWEEN_REQUESTS = 3.0  # seconds
-    
+    CONCURRENCY = 8  # max in-flight requests
+    MAX_QPS = 5.0  # request rate cap (token bucket)
+    BATCH_SIZE = 16  # queries per API round-trip
+
     logger.info("=" * 60)
     logger.info("SHL Assessment Recommendation System - Testing Script")
     logger.info("=" * 60)
-    
+
     try:
         # Initialize test runner
-        runner = TestRunner(api_url=API_URL)
-        
-        # Check API health
-        logger.info("\nStep 1: Checking API health...")
-        if not runner.check_api_health():
-            logger.error("\n❌ API is not available!")
-            logger.error("Please make sure the server is running:")
-            logger.error("  python run.py")
-            return 1
-        
-        # Load test set
-        logger.info("\nStep 2: Loading test set...")
-        test_set_path = Path(TEST_SET_FILE)
-        
-        if not test_set_path.exists():
-            logger.error(f"\n❌ Test set not found: {TEST_SET_FILE}")
-            logger.error("Please make sure Test-Set.json is in the data/ directory")
-            return 1
-        
-        test_set = runner.load_test_set(TEST_SET_FILE)
-        
-        # Run tests
-        logger.info("\nStep 3: Running tests...")
-        logger.info(f"  Delay between requests: {DELAY_BETWEEN_REQUESTS}s")
-        
-        results = runner.run_tests(test_set, delay=DELAY_BETWEEN_REQUESTS)
-        
-        # Save results
-        logger.info("\nStep 4: Saving results...")
-        output_path = Path(OUTPUT_FILE)
-        runner.save_to_csv(results, str(output_path))
-        
-        # Generate summary
-        logger.info("\nStep 5: Generating summary...")
-        runner.generate_summary(results, test_set)
-        
-        # Final message
-        logger.info("\n" + "=" * 60)
-        logger.info("✅ TESTING COMPLETED SUCCESSFULLY!")
-        logger.info("=" * 60)
-        logger.info(f"Output file: {output_path.absolute()}")
-        logger.info(f"Total queries processed: {len(test_set)}")
-        logger.info(f"Total recommendations: {len(results)}")
-        logger.info("=" * 60)
-        
-        return 0
-        
+        async with TestRunner(api_url=API_URL, concurrency=CONCURRENCY,
+                              max_qps=MAX_QPS, batch_size=BATCH_SIZE) as runner:
+
+            # Check API health
+            logger.info("\nStep 1: Checking API health...")
+            if not runner.check_api_health():
+                logger.error("\n❌ API is not available!")
+                logger.error("Please make sure the server is running:")
+                logger.error("  python run.py")
+                return 1
+
+            # Load test set
+            logger.info("\nStep 2: Loading test set...")
+            test_set_path = Path(TEST_SET_FILE)
+
+            if not test_set_path.exists():
+                logger.error(f"\n❌ Test set not found: {TEST_SET_FILE}")
+                logger.error("Please make sure Test-Set.json is in the data/ directory")
+                return 1
+
+            test_set = runner.load_test_set(TEST_SET_FILE)
+
+            # Run tests, streaming rows straight into the CSV
+            logger.info("\nStep 3: Running tests and saving results...")
+            logger.info(f"  Concurrency: {CONCURRENCY}")
+
+            logger.info(f"  Rate cap: {MAX_QPS} QPS")
+
+            output_path = Path(OUTPUT_FILE)
+            total_rows = await runner.save_to_csv(
+                runner.run_tests(test_set),
+                str(output_path)
+            )
+
+            # Generate summary
+            logger.info("\nStep 4: Generating summary...")
+            runner.generate_summary(runner.query_counts, test_set)
+
+            # Final message
+            logger.info("\n" + "=" * 60)
+            logger.info("✅ TESTING COMPLETED SUCCESSFULLY!")
+            logger.info("=" * 60)
+            logger.info(f"Output file: {output_path.absolute()}")
+            logger.info(f"Total queries processed: {len(test_set)}")
+            logger.info(f"Total recommendations: {total_rows}")
+            logger.info("=" * 60)
+
+            return 0
+
     except KeyboardInterrupt:
         logger.warning("\n\n⚠️  Testing interrupted by user")
         return 1
@@ -317,5 +615,13 @@ def main():
 
 
 if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    # uvloop cuts asyncio overhead for high-fanout network workloads;
+    # fall back to the default loop where it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
@@ -0,0 +1,316 @@
+"""
+Combined launcher for the FastAPI backend and Chainlit UI
+
+By default both servers run in-process on daemon threads, sharing one
+interpreter and heap; pass --isolated to spawn them as separate child
+processes instead. Either way the launcher probes for readiness rather
+than sleeping for a fixed interval.
+
+Usage:
+    python startup.py [--isolated]
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+READY_TIMEOUT = 30.0  # seconds to wait for each server
+
+
+def get_port(default: int, env_var: str) -> int:
+    """Get a port number from the environment with a fallback"""
+    return int(os.environ.get(env_var, default))
+
+
+def _spawn(script: str, env_var: str, port: int) -> subprocess.Popen:
+    """
+    Spawn a child interpreter running the given entry script
+
+    Each child leads its own session/process group so cleanup can
+    signal the whole group (catching any grandchildren the servers
+    fork). No preexec_fn is set, keeping Popen on its fast spawn path.
+
+    Args:
+        script: Entry script to run
+        env_var: Environment variable carrying the port
+        port: Port number for the child
+
+    Returns:
+        The child process handle
+    """
+    env = os.environ.copy()
+    env[env_var] = str(port)
+
+    return subprocess.Popen(
+        [sys.executable, script],
+        executable=sys.executable,
+        env=env,
+        start_new_session=True,
+        close_fds=True
+    )
+
+
+def start_fastapi(port: int) -> subprocess.Popen:
+    """Start the FastAPI server as a child process"""
+    # Settings is case-sensitive and binds API_PORT, not PORT
+    return _spawn("run.py", "API_PORT", port)
+
+
+def start_chainlit(port: int) -> subprocess.Popen:
+    """Start the Chainlit UI as a child process"""
+    return _spawn("run_chainlit.py", "CHAINLIT_PORT", port)
+
+
+def wait_for_http(url: str, timeout: float = READY_TIMEOUT) -> bool:
+    """
+    Poll an HTTP endpoint until it responds 200 or the timeout elapses
+
+    Args:
+        url: Endpoint to probe
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the endpoint became ready
+    """
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=0.5).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+
+    return False
+
+
+def wait_for_tcp(host: str, port: int, timeout: float = READY_TIMEOUT) -> bool:
+    """
+    Poll a TCP port until it accepts connections or the timeout elapses
+
+    Chainlit has no dedicated health route, so a plain connect probe
+    stands in for one.
+
+    Args:
+        host: Host to probe
+        port: TCP port to probe
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the port became reachable
+    """
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(0.1)
+
+    return False
+
+
+def print_success_message(fastapi_port: int, chainlit_port: int):
+    """Print the startup banner with service URLs"""
+    print("=" * 60)
+    print("SHL Assessment Recommendation System is up")
+    print("=" * 60)
+    print(f"FastAPI backend: http://localhost:{fastapi_port}")
+    print(f"Chainlit UI:     http://localhost:{chainlit_port}")
+    print("Press Ctrl+C to stop both servers")
+    print("=" * 60)
+
+
+def cleanup(processes):
+    """Terminate child process groups and wait for them to exit"""
+    for process in processes:
+        if process.poll() is None:
+            # Signal the whole group so grandchildren are reaped too
+            try:
+                os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                process.terminate()
+
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                process.kill()
+
+
+def start_inprocess_servers(fastapi_port: int, chainlit_port: int) -> list:
+    """
+    Run both servers on daemon threads in this interpreter
+
+    Skips one interpreter startup and import pass per server and keeps
+    a single shared heap, at the cost of process isolation.
+
+    Args:
+        fastapi_port: Port for the FastAPI server
+        chainlit_port: Port for the Chainlit UI
+
+    Returns:
+        The server threads
+    """
+    import uvicorn
+
+    config = uvicorn.Config(
+        "app.main:app",
+        host="0.0.0.0",
+        port=fastapi_port,
+        workers=1,
+        log_level="info"
+    )
+    server = uvicorn.Server(config)
+    fastapi_thread = threading.Thread(target=server.run, name="fastapi", daemon=True)
+    fastapi_thread.start()
+
+    def run_ui():
+        os.environ.setdefault('CHAINLIT_HOST', '0.0.0.0')
+        os.environ['CHAINLIT_PORT'] = str(chainlit_port)
+        from chainlit.cli import run_chainlit
+        run_chainlit("chainlit_app/app.py")
+
+    chainlit_thread = threading.Thread(target=run_ui, name="chainlit", daemon=True)
+    chainlit_thread.start()
+
+    return [fastapi_thread, chainlit_thread]
+
+
+def run_inprocess(fastapi_port: int, chainlit_port: int) -> int:
+    """Run both servers in-process and supervise until one stops"""
+    threads = start_inprocess_servers(fastapi_port, chainlit_port)
+
+    stop = threading.Event()
+
+    def handle_signal(signum, frame):
+        stop.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    if not wait_for_http(f"http://127.0.0.1:{fastapi_port}/api/health"):
+        print(f"ERROR: FastAPI did not become ready within {READY_TIMEOUT}s",
+              file=sys.stderr)
+        return 1
+
+    if not wait_for_tcp("127.0.0.1", chainlit_port):
+        print(f"ERROR: Chainlit did not become ready within {READY_TIMEOUT}s",
+              file=sys.stderr)
+        return 1
+
+    print_success_message(fastapi_port, chainlit_port)
+
+    # Threads have no SIGCHLD equivalent, so wake periodically to
+    # notice a dead server between signals
+    while not stop.is_set():
+        if not all(thread.is_alive() for thread in threads):
+            print("A server thread exited, shutting down", file=sys.stderr)
+            return 1
+        stop.wait(timeout=1)
+
+    # Daemon threads die with the interpreter
+    return 0
+
+
+def run_isolated(fastapi_port: int, chainlit_port: int) -> int:
+    """Launch both servers as child processes and supervise them"""
+    # Set while a child exits; the supervisor blocks on it instead of
+    # polling the children every second
+    child_exited = threading.Event()
+
+    def handle_sigchld(signum, frame):
+        # Reap everything that has exited without blocking
+        while True:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            child_exited.set()
+
+    # Install before spawning so no exit can slip through unreaped
+    signal.signal(signal.SIGCHLD, handle_sigchld)
+
+    # Launch both children back-to-back; readiness is probed below
+    # instead of sleeping for a fixed cushion
+    fastapi_process = start_fastapi(fastapi_port)
+    chainlit_process = start_chainlit(chainlit_port)
+    processes = [fastapi_process, chainlit_process]
+
+    def handle_signal(signum, frame):
+        cleanup(processes)
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    try:
+        if not wait_for_http(f"http://127.0.0.1:{fastapi_port}/api/health"):
+            print(f"ERROR: FastAPI did not become ready within {READY_TIMEOUT}s",
+                  file=sys.stderr)
+            cleanup(processes)
+            return 1
+
+        if not wait_for_tcp("127.0.0.1", chainlit_port):
+            print(f"ERROR: Chainlit did not become ready within {READY_TIMEOUT}s",
+                  file=sys.stderr)
+            cleanup(processes)
+            return 1
+
+        print_success_message(fastapi_port, chainlit_port)
+
+        # Supervise: sleep in the kernel until SIGCHLD reports a death
+        child_exited.wait()
+
+        if fastapi_process.poll() is not None:
+            print("FastAPI server exited, shutting down", file=sys.stderr)
+        else:
+            print("Chainlit server exited, shutting down", file=sys.stderr)
+
+        cleanup(processes)
+        return 1
+
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        cleanup(processes)
+        return 1
+
+
+def main() -> int:
+    """Launch both servers and supervise them until one exits"""
+    parser = argparse.ArgumentParser(description="Launch the FastAPI backend and Chainlit UI")
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run each server in its own child process instead of in-process threads"
+    )
+    args = parser.parse_args()
+
+    print("Starting SHL Assessment Recommendation System...")
+
+    # Resolve ports once; every later consumer gets the same values
+    # even if the environment changes mid-startup
+    fastapi_port = get_port(8000, "FASTAPI_PORT")
+    chainlit_port = get_port(8001, "CHAINLIT_PORT")
+
+    if args.isolated:
+        return run_isolated(fastapi_port, chainlit_port)
+    return run_inprocess(fastapi_port, chainlit_port)
+
+
+if __name__ == "__main__":
+    sys.exit(main())